@@ -20,6 +20,10 @@ const uint32_t SAMPLE_DELAY_US = 500;  // ~2 kHz for 50/60 Hz content
 const float CT_SENS_V_PER_A = 0.556f;  // ~0.556 V/A RMS at ADC node
 const float TURNS_RATIO = 3100;
 
+// Binary serial frame: 2 sync bytes, then ia, ib, ic as little-endian float32,
+// then the low byte of the sum of those 12 payload bytes
+const uint8_t FRAME_SYNC[2] = {0xAA, 0x55};
+
 void setup() {
   Serial.begin(115200);
   adc_configure(SHUNT_PIN_1, 12, ADC_11db);
@@ -44,8 +48,16 @@ void loop() {
   ib = (adc_read_voltage(SHUNT_PIN_1) - bias) / R_SHUNT * TURNS_RATIO;
   ic = (adc_read_voltage(SHUNT_PIN_1) - bias) / R_SHUNT * TURNS_RATIO;
 
-  Serial.printf("ia:%0.5f ib:%0.5f ic:%0.5f\n",
-              ia, ib, ic);
+  // Serial.printf("ia:%0.5f ib:%0.5f ic:%0.5f\n",
+  //             ia, ib, ic);
+  float currents[3] = {ia, ib, ic};
+  Serial.write(FRAME_SYNC, sizeof(FRAME_SYNC));
+  Serial.write((const uint8_t *)currents, sizeof(currents));
+  uint8_t checksum = 0;
+  for (size_t i = 0; i < sizeof(currents); i++) {
+    checksum += ((const uint8_t *)currents)[i];
+  }
+  Serial.write(checksum);
 
   // esp_transmitter.send(packet);
   delay(0.1);
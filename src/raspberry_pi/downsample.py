@@ -0,0 +1,61 @@
+import numpy as np
+
+
+def lttb(x, y, n_out):
+    """Largest-Triangle-Three-Buckets downsampling of a line to n_out points.
+
+    Keeps the first and last points; every bucket in between contributes the
+    point spanning the largest triangle with the previously kept point and the
+    mean of the next bucket, so peaks survive. Returns (x, y) unchanged when
+    there is nothing to drop.
+    """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return x, y
+
+    # Bucket edges for the n - 2 interior points, split into n_out - 2 buckets
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.intp)
+    # Next-bucket means in one pass; the last bucket looks at the final point
+    sums_x = np.add.reduceat(x[1:n - 1], edges[:-1] - 1)
+    sums_y = np.add.reduceat(y[1:n - 1], edges[:-1] - 1)
+    counts = np.diff(edges)
+    avg_x = np.append(sums_x[1:] / counts[1:], x[-1])
+    avg_y = np.append(sums_y[1:] / counts[1:], y[-1])
+
+    keep = np.empty(n_out, dtype=np.intp)
+    keep[0] = 0
+    keep[-1] = n - 1
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        # Twice the triangle area; the factor doesn't change the argmax
+        area = np.abs((x[a] - avg_x[i]) * (y[lo:hi] - y[a])
+                      - (x[a] - x[lo:hi]) * (avg_y[i] - y[a]))
+        a = lo + int(np.argmax(area))
+        keep[i + 1] = a
+    return x[keep], y[keep]
+
+
+def min_max(x, y, n_buckets):
+    """Min/max decimation: the lowest and highest point of each of n_buckets.
+
+    Keeps the envelope of oscillating signals (e.g. phase currents) that a
+    plain stride would alias. Returns (x, y) unchanged when the input has no
+    more than two points per bucket.
+    """
+    n = len(x)
+    if n <= 2 * n_buckets or n_buckets < 1:
+        return x, y
+
+    # Equal-size buckets over the first n_buckets * size points; the few
+    # leftover points at the end are kept as they are
+    size = n // n_buckets
+    m = size * n_buckets
+    buckets = y[:m].reshape(n_buckets, size)
+    offsets = np.arange(0, m, size)
+    keep = np.concatenate((offsets + buckets.argmin(axis=1),
+                           offsets + buckets.argmax(axis=1),
+                           np.arange(m, n)))
+    # Time order, and a flat bucket's min and max index collapse into one
+    keep = np.unique(keep)
+    return x[keep], y[keep]
@@ -4,6 +4,7 @@ import scipy
 from fault import MotorFaultDetector
 
 file_path = "experiment2.csv"
+MAX_PLOT_POINTS = 5000
 
 # sampling = 16 ms
 # 62.5 Hz - fundamental frequency
@@ -49,46 +50,30 @@ def main():
     mse = detector.least_squares_v1(ia, ib, ic)
     print(f"Mean Squared Error: {mse}")
 
-    plt.figure(figsize=(6, 6))
-    plt.plot(time, ia, 'o')
-    # plt.plot(id_initial, iq_initial, linewidth=0.5)
-    plt.xlabel("t")
-    plt.ylabel("i_a")
-    plt.grid(True)
-    # plt.axis("equal")
-    plt.axis("tight")
-    plt.show()
-
-    plt.figure(figsize=(6, 6))
-    plt.plot(time, ib, 'o')
-    # plt.plot(id_initial, iq_initial, linewidth=0.5)
-    plt.xlabel("t")
-    plt.ylabel("i_b")
-    plt.grid(True)
-    # plt.axis("equal")
-    plt.axis("tight")
-    plt.show()
+    # Plot everything in one window so the GUI main loop is entered once.
+    # Long recordings are strided down to MAX_PLOT_POINTS markers per trace.
+    step = max(1, len(time) // MAX_PLOT_POINTS)
+    fig, axs = plt.subplots(2, 2, figsize=(10, 10))
 
-    plt.figure(figsize=(6, 6))
-    plt.plot(time, ic, 'o')
-    # plt.plot(id_initial, iq_initial, linewidth=0.5)
-    plt.xlabel("t")
-    plt.ylabel("i_c")
-    plt.grid(True)
-    # plt.axis("equal")
-    plt.axis("tight")
-    plt.show()
+    for ax, values, label in ((axs[0, 0], ia, "i_a"), (axs[0, 1], ib, "i_b"), (axs[1, 0], ic, "i_c")):
+        ax.plot(time[::step], values[::step], 'o')
+        ax.set_xlabel("t")
+        ax.set_ylabel(label)
+        ax.grid(True)
+        ax.axis("tight")
 
     # 4. Plot Result (Filtered Lissajous Curve)
-    plt.figure(figsize=(6, 6))
-    plt.plot(id_initial, iq_initial, 'o')
-    # plt.plot(id_initial, iq_initial, linewidth=0.5)
-    plt.title("Filtered Park's Vector Pattern")
-    plt.xlabel("i_d")
-    plt.ylabel("i_q")
-    plt.grid(True)
-    # plt.axis("equal")
-    plt.axis("tight")
+    ax = axs[1, 1]
+    ax.plot(id_initial[::step], iq_initial[::step], 'o')
+    # ax.plot(id_initial, iq_initial, linewidth=0.5)
+    ax.set_title("Filtered Park's Vector Pattern")
+    ax.set_xlabel("i_d")
+    ax.set_ylabel("i_q")
+    ax.grid(True)
+    # ax.axis("equal")
+    ax.axis("tight")
+
+    fig.tight_layout()
     plt.show()
 
 if __name__ == "__main__":
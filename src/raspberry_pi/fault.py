@@ -1,13 +1,39 @@
+import math
+from functools import lru_cache
+
 import numpy as np
+import scipy.fft
 import scipy.signal as signal
-from scipy.interpolate import interp1d
-from scipy.optimize import curve_fit
+
+
+@lru_cache(maxsize=8)
+def _hann_window(n):
+    # Shared between calls, so hand out a read-only array
+    window = signal.windows.hann(n)
+    window.flags.writeable = False
+    return window
 
 
 class MotorFaultDetector:
-    def __init__(self, fs_target=3600, f0_target=60): # replicating the frequencies described in Isak's paper
+    # The pipeline runs in float32 end to end: sensor payloads arrive as
+    # 32-bit floats, and it halves memory traffic on long signals.
+    DTYPE = np.float32
+
+    # Park transform coefficients
+    _C23 = DTYPE(math.sqrt(2/3))
+    _INV_SQRT6 = DTYPE(1 / math.sqrt(6))
+    _INV_SQRT2 = DTYPE(1 / math.sqrt(2))
+
+    # Rows map (ia, ib, ic) onto i_d and i_q
+    _PARK = np.array([
+        [_C23, -_INV_SQRT6, -_INV_SQRT6],
+        [0, _INV_SQRT2, -_INV_SQRT2],
+    ], dtype=DTYPE)
+
+    def __init__(self, fs_target=3600, f0_target=60, use_fir=False): # replicating the frequencies described in Isak's paper
         self.fs_target = fs_target
         self.f0_target = f0_target
+        self.use_fir = use_fir
 
         # 1. Elliptic Low-Pass: Order 5, Ripple 40dB, Stop 84dB, Cutoff 430Hz
         self.ellip_b, self.ellip_a = signal.ellip(5, 40, 84, 430, btype='lowpass', fs=self.fs_target)
@@ -15,6 +41,19 @@ class MotorFaultDetector:
         # 2. Notch Filter: 60Hz, Q=1
         self.notch_b, self.notch_a = signal.iirnotch(60, Q=1, fs=self.fs_target)
 
+        # Both stages as one cascade of second-order sections, so filtering
+        # is a single sosfilt call (and better conditioned than high-order b/a)
+        self.sos = np.vstack([
+            signal.tf2sos(self.ellip_b, self.ellip_a),
+            signal.tf2sos(self.notch_b, self.notch_a),
+        ]).astype(self.DTYPE)
+
+        # Optional FIR stand-in for the elliptic low-pass (same 430Hz cutoff).
+        # FIR filtering maps to FFT convolution, which wins on long signals.
+        # Designed on first use by apply_filters_fir.
+        self.fir_taps = None
+        self.notch_sos = None
+
     # def upsample_data(self, time, ia, ib, ic, target_fs):
     #     duration = time[-1] - time[0]
     #     num_points = int(duration * target_fs)
@@ -34,41 +73,52 @@ class MotorFaultDetector:
         
     #     return new_time, new_ia, new_ib, new_ic
 
-    def compute_park_vector(self, ia, ib, ic):
-        # Assuming ia, ib, ic are numpy arrays
-        i_d = (np.sqrt(2/3) * ia) - (ib / np.sqrt(6)) - (ic / np.sqrt(6))
-        i_q = (ib / np.sqrt(2)) - (ic / np.sqrt(2))
+    def compute_park_vector(self, ia, ib, ic, offsets=None):
+        # Inputs are only read, never written: asarray is a no-op for float32
+        # arrays (e.g. ring buffer windows), so the stack is the one copy made
+        abc = np.stack((
+            np.asarray(ia, dtype=self.DTYPE),
+            np.asarray(ib, dtype=self.DTYPE),
+            np.asarray(ic, dtype=self.DTYPE),
+        ))
+        if offsets is not None:
+            # Per-phase DC removal, done in place on the stacked copy
+            abc -= np.asarray(offsets, dtype=self.DTYPE)[:, None]
+        i_d, i_q = self._PARK @ abc
         return i_d, i_q
 
-    def scale_trajectory(self, i_d, i_q):
+    def scale_trajectory(self, i_d, i_q, inplace=False):
         # Calculate distance from origin for every point
-        r = np.sqrt(i_d**2 + i_q**2)
+        r = np.hypot(i_d, i_q)
         r_mean = np.mean(r)
         
         if r_mean == 0:
             return i_d, i_q
 
-        # Scale
+        # Scale (inplace=True overwrites the caller's arrays, which must be float)
+        if inplace:
+            i_d /= r_mean
+            i_q /= r_mean
+            return i_d, i_q
+
         i_d_scaled = i_d / r_mean
         i_q_scaled = i_q / r_mean
         
         return i_d_scaled, i_q_scaled
 
-    def apply_odt(self, values, fs_original, f0_detected):
-        # # 1. Estimate fundamental frequency (f0) using FFT peak detection [cite: 426]
-        # # Use a window to reduce spectral leakage
-        # window = signal.windows.hann(len(values))
-        # fft_vals = np.fft.rfft(values * window)
-        # fft_freq = np.fft.rfftfreq(len(values), d=1/fs_original)
-        
-        # # Find peak frequency (ignore DC component at index 0)
-        # peak_idx = np.argmax(np.abs(fft_vals[1:])) + 1
-        # f0_detected = fft_freq[peak_idx]
+    def estimate_f0(self, values, fs_original):
+        # 1. Estimate fundamental frequency (f0) using FFT peak detection [cite: 426]
+        # Use a window to reduce spectral leakage
+        N = len(values)
+        fft_vals = scipy.fft.rfft(values * _hann_window(N), workers=-1)
+        fft_freq = scipy.fft.rfftfreq(N, d=1/fs_original)
 
-        # if f0_detected <= 0:
-        #     return values # Fallback
+        # Find peak frequency (ignore DC component at index 0)
+        peak_idx = np.argmax(np.abs(fft_vals[1:])) + 1
+        return fft_freq[peak_idx]
 
-        # f0_detected = 50
+    def apply_odt(self, values, fs_original, f0_detected):
+        # 1. f0_detected comes from the caller (see estimate_f0)
 
         # 2. Calculate number of periods T (Eq 3.8) [cite: 430]
         N = len(values)
@@ -78,52 +128,81 @@ class MotorFaultDetector:
         S = int((self.fs_target * T) / self.f0_target)
 
         # 4. Interpolate (Eq 3.10) [cite: 438]
-        x_old = np.linspace(0, 1, N)
-        x_new = np.linspace(0, 1, S)
-        
-        interpolator = interp1d(x_old, values, kind='linear')
-        return interpolator(x_new)
+        # Both grids are evenly spaced on [0, 1], so each new sample maps to
+        # a fractional index k * (N-1)/(S-1) in the old one; no search needed.
+        values = np.asarray(values)
+        if N < 2 or S < 2:
+            return np.full(max(S, 0), values[0] if N else np.nan)
+
+        idx = np.arange(S) * ((N - 1) / (S - 1))
+        lo = np.minimum(idx.astype(np.intp), N - 2)
+        frac = (idx - lo).astype(self.DTYPE)
+        return values[lo] + frac * (values[lo + 1] - values[lo])
 
     def apply_filters(self, data):
-        # Apply Elliptic
-        filtered_1 = signal.lfilter(self.ellip_b, self.ellip_a, data)
-        # Apply Notch
-        filtered_final = signal.lfilter(self.notch_b, self.notch_a, filtered_1)
-        return filtered_final
+        if self.use_fir:
+            return self.apply_filters_fir(data)
+        # Elliptic low-pass followed by the notch, in one pass
+        return signal.sosfilt(self.sos, data)
+
+    def apply_filters_fir(self, data):
+        # FIR low-pass via overlap-add convolution, then the notch
+        if self.fir_taps is None:
+            self.fir_taps = signal.firwin(64, 430, fs=self.fs_target).astype(self.DTYPE)
+            self.notch_sos = signal.tf2sos(self.notch_b, self.notch_a).astype(self.DTYPE)
+        data = np.asarray(data)
+        taps = self.fir_taps.reshape((1,) * (data.ndim - 1) + (-1,))
+        low_passed = signal.oaconvolve(data, taps, mode='same', axes=-1)
+        return signal.sosfilt(self.notch_sos, low_passed)
     
     def process_pipeline_minimal(self, ia, ib, ic):
         id, iq = self.compute_park_vector(ia, ib, ic)
-        return self.scale_trajectory(id, iq)
+        # id/iq are fresh arrays owned by this method, so scale them in place
+        return self.scale_trajectory(id, iq, inplace=True)
     
     def process_park_vector(self, ia, ib, ic):
         return self.compute_park_vector(ia, ib, ic)
 
-    def process_pipeline(self, ia, ib, ic, fs_original, f0_detected):
+    def process_pipeline(self, ia, ib, ic, fs_original, f0_detected=None):
         # Step 2: Calculate Id, Iq
         id_raw, iq_raw = self.compute_park_vector(ia, ib, ic)
         
         # Step 3: Scaling
         id_scaled, iq_scaled = self.scale_trajectory(id_raw, iq_raw)
         
+        # Without a known supply frequency, take it from the spectrum of Id
+        # (the Park's vector rotates at f0, so Id and Iq share it)
+        if f0_detected is None:
+            f0_detected = self.estimate_f0(id_scaled, fs_original)
+        
         # Step 4: ODT (Process Id and Iq separately)
         id_odt = self.apply_odt(id_scaled, fs_original, f0_detected)
         iq_odt = self.apply_odt(iq_scaled, fs_original, f0_detected)
         
-        # Step 5: Filter
-        id_final = self.apply_filters(id_odt)
-        iq_final = self.apply_filters(iq_odt)
+        # Step 5: Filter (both channels share the coefficients, so filter
+        # them as one (2, S) block along the last axis)
+        id_final, iq_final = self.apply_filters(np.stack((id_odt, iq_odt)))
         
         return id_final, iq_final
     
     def least_squares_v1(self, ia, ib, ic):
         id_raw, iq_raw = self.compute_park_vector(ia, ib, ic)
 
-        id_scaled, iq_scaled = self.scale_trajectory(id_raw, iq_raw)
-
-        PVM = np.sqrt(id_scaled ** 2 + iq_scaled ** 2)
+        # Park's vector modulus before scaling. PVM = r / r_mean, so
+        # mean((PVM - healthy)^2) expands into the first two moments of r
+        # and the scaled arrays never need to be built.
+        # Accumulate in float64: the MSE is a small difference of moments.
+        r = np.hypot(id_raw, iq_raw)
+        n = len(r)
+        r_mean = np.sum(r, dtype=np.float64) / n
+        r_sq_mean = np.sum(np.square(r, out=r), dtype=np.float64) / n
 
         healthy = 1.0
 
-        mse = np.mean((PVM - healthy) ** 2)
+        if r_mean == 0:
+            # scale_trajectory leaves the trajectory untouched in this case
+            return r_sq_mean - 2 * healthy * r_mean + healthy ** 2
+
+        mse = r_sq_mean / r_mean ** 2 - 2 * healthy + healthy ** 2
 
         return mse
\ No newline at end of file
@@ -1,6 +1,4 @@
 import numpy as np
-import scipy.signal as signal
-from scipy.interpolate import interp1d
 from scipy.optimize import curve_fit
 
 def sine_model(t, amp, freq_hz, phase_rad, offset):
@@ -17,21 +15,64 @@ def sine_model(t, amp, freq_hz, phase_rad, offset):
 def fit_sine_wave(t_data, y_data, freq_guess):
     """
     Performs the curve fitting on a single phase.
+    With the frequency fixed at freq_guess the model is linear in
+    [amp*cos(phase), amp*sin(phase), offset], so it is solved in closed form;
+    up to two Gauss-Newton steps on all four parameters then refine the
+    frequency. If they haven't converged (freq_guess too far off),
+    curve_fit takes over from the refined parameters.
+    Returns [amp, freq, phase, offset] like the sine_model arguments, with
+    amp >= 0 and phase in (-pi, pi].
     """
-    # 1. Generate initial parameter guesses (crucial for success)
-    guess_offset = np.mean(y_data)
-    # Estimate amplitude from max/min
-    guess_amp = (np.max(y_data) - np.min(y_data)) / 2
-    guess_phase = 0
-    
-    # Pack guesses: [amp, freq, phase, offset]
-    p0 = [guess_amp, freq_guess, guess_phase, guess_offset]
+    t_data = np.asarray(t_data, dtype=float)
+    y_data = np.asarray(y_data, dtype=float)
+    w = 2 * np.pi * freq_guess
 
     try:
-        # 2. Run the optimization
-        # curve_fit tries to minimize the squared difference between the model and the data
-        params, covariance = curve_fit(sine_model, t_data, y_data, p0=p0, maxfev=10000)
+        # 1. Linear least squares at the guessed frequency
+        A = np.column_stack([np.sin(w * t_data), np.cos(w * t_data), np.ones_like(t_data)])
+        c = np.linalg.lstsq(A, y_data, rcond=None)[0]
+        params = np.array([np.hypot(c[0], c[1]), freq_guess, np.arctan2(c[1], c[0]), c[2]])
+    except np.linalg.LinAlgError:
+        print("Error: Sine fit failed. Check initial frequency guess.")
+        return None
+
+    # A flat signal has no sinusoid to refine (and a singular Jacobian)
+    if params[0] <= 1e-12 * max(np.max(np.abs(y_data)), 1.0):
         return params
-    except RuntimeError:
-        print("Error: Curve fit failed to converge. Check initial frequency guess.")
-        return None
\ No newline at end of file
+
+    # 2. Gauss-Newton steps, each kept only if it lowers the residual
+    residual = y_data - sine_model(t_data, *params)
+    cost = np.dot(residual, residual)
+    converged = False
+    for _ in range(2):
+        amp, freq, phase, offset = params
+        arg = 2 * np.pi * freq * t_data + phase
+        J = np.column_stack([
+            np.sin(arg),
+            amp * np.cos(arg) * 2 * np.pi * t_data,
+            amp * np.cos(arg),
+            np.ones_like(t_data),
+        ])
+        refined = params + np.linalg.lstsq(J, residual, rcond=None)[0]
+        refined_residual = y_data - sine_model(t_data, *refined)
+        refined_cost = np.dot(refined_residual, refined_residual)
+        if refined_cost >= cost:
+            break
+        converged = cost - refined_cost <= 1e-6 * cost
+        params, residual, cost = refined, refined_residual, refined_cost
+        if converged:
+            break
+
+    # 3. Still moving: the guess was outside the quadratic basin, so let
+    # curve_fit iterate from where the steps got to
+    if not converged:
+        try:
+            params = curve_fit(sine_model, t_data, y_data, p0=params, maxfev=10000)[0]
+        except RuntimeError:
+            pass
+
+    amp, freq, phase, offset = params
+    if amp < 0:
+        amp, phase = -amp, phase + np.pi
+    phase = np.pi - (np.pi - phase) % (2 * np.pi)
+    return np.array([amp, freq, phase, offset])
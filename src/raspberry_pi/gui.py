@@ -23,15 +23,20 @@ from datetime import datetime
 import threading
 import asyncio
 import time
-import queue
 from collections import deque
 from matplotlib.figure import Figure
+from matplotlib.patches import Circle
+from matplotlib.collections import PolyCollection
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 import os
 import math
+import numpy as np
+import scipy.fft
 
 # Import BLE handler
 import main
+from ring_buffer import RingBuffer
+from downsample import lttb, min_max
 
 # ============================================================================
 # CONFIGURATION
@@ -51,13 +56,35 @@ COLORS = {
     "white": "#ffffff",
 }
 
+# Status colors resolved once, so refresh() does a single lookup per label
+STATUS_BADGE_FG = {
+    "Good": COLORS["success"],
+    "Fault": COLORS["danger"],
+}
+STATUS_BAR_COLORS = {                      # status -> (bg, fg)
+    "Good": (COLORS["success"], COLORS["white"]),
+    "Fault": (COLORS["danger"], COLORS["white"]),
+}
+STATUS_BAR_DEFAULT = (COLORS["gray_light"], COLORS["primary"])
+
 # Buffer sizes for real-time plotting
 # Larger accel/temp buffer so x-axis shows a longer window
 MAX_ACCEL_TEMP_POINTS = 300  # ~10 seconds of data (depending on sample rate)
 MAX_CURRENT_POINTS = 100     # Increased to show more Park's vector data points
+MAX_DRAIN_SAMPLES = 500      # Max queued samples; the producer drops the oldest beyond this
 ROOM_TEMP_C = 25.0           # Baseline room temperature for warnings
 TEMP_WARN_DELTA_C = 5.0      # Warn if above room + this delta (more sensitive)
 TEMP_WARN_HYST_C = 1.0       # Hysteresis to avoid rapid toggling
+TEMP_WARN_THRESHOLD_C = ROOM_TEMP_C + TEMP_WARN_DELTA_C
+REDRAW_INTERVAL_MS = 16      # Min time between plot redraws (~60 FPS)
+PLOT_MIN_INTERVAL_S = {      # Per-plot redraw throttle; slower signals redraw less often
+    "currents": 0.0,         # every redraw
+    "parks": 0.1,
+    "accel": 0.1,
+    "temp": 0.5,
+}
+PARKS_PLOT_LIM = 1.5         # Initial +/- axis limit of the scaled Park's vector plot
+SCROLL_LOOKAHEAD = 0.25      # Time axes jump ahead by this fraction of the window
 LOGO_MAX_W = 110             # Max logo width (px) to keep it compact in header
 LOGO_MAX_H = 60              # Max logo height (px)
 ACCEL_RUN_MAG_THRESHOLD = 0.02  # g threshold to consider motor running (more sensitive)
@@ -91,10 +118,11 @@ class MotorApp(tk.Tk):
         self._asset_dir = os.path.join(os.path.dirname(__file__), "assets")
         self._nasa_logo_img = None
         # Vibration monitoring state
-        self._accel_mag_buf = deque(maxlen=ACCEL_WINDOW_SAMPLES * 3)
+        self._accel_mag_buf = RingBuffer(ACCEL_WINDOW_SAMPLES * 3, dtype=np.float64)
         self._vibe_baseline_ready = False
         self._vibe_baseline_mean = 0.0
         self._vibe_baseline_std = 0.0
+        self._vibe_threshold = 0.0      # RMS warning level, set with the baseline
         self._vibe_consec_high = 0
         self._vibe_consec_clear = 0
         # Warning history
@@ -111,29 +139,30 @@ class MotorApp(tk.Tk):
             "warning": ""              # Warning message for UI
         }
         
-        # Data buffers (deque auto-removes old data when full)
-        self.data_buffers = {
-            # Acceleration and temperature (short buffer)
-            'accel_ts': deque(maxlen=MAX_ACCEL_TEMP_POINTS),
-            'accel_x': deque(maxlen=MAX_ACCEL_TEMP_POINTS),
-            'accel_y': deque(maxlen=MAX_ACCEL_TEMP_POINTS),
-            'accel_z': deque(maxlen=MAX_ACCEL_TEMP_POINTS),
-            'temp_ts': deque(maxlen=MAX_ACCEL_TEMP_POINTS),
-            'temp_vals': deque(maxlen=MAX_ACCEL_TEMP_POINTS),
-            # 3-phase currents (for time-domain plot)
-            'current_ts': deque(maxlen=MAX_CURRENT_POINTS),
-            'ia': deque(maxlen=MAX_CURRENT_POINTS),
-            'ib': deque(maxlen=MAX_CURRENT_POINTS),
-            'ic': deque(maxlen=MAX_CURRENT_POINTS),
-            # Filtered Park's vector (longer buffer for pattern)
-            'filtered_id': deque(maxlen=2*MAX_CURRENT_POINTS),
-            'filtered_iq': deque(maxlen=2*MAX_CURRENT_POINTS),
-        }
+        # Data buffers: preallocated ring buffers, one row per sample and one
+        # column per series, so plotting takes array views instead of copying deques.
+        # Signals are float32 like the sensor payloads (half the bytes through the
+        # FFT and Agg); timestamps stay float64, as float32 seconds-since-start
+        # drop below millisecond resolution after a couple of hours.
+        # Acceleration and temperature: ax, ay, az, temp
+        self.accel_temp_ts = RingBuffer(MAX_ACCEL_TEMP_POINTS, dtype=np.float64)
+        self.accel_temp_buf = RingBuffer(MAX_ACCEL_TEMP_POINTS, channels=4)
+        # 3-phase currents (for time-domain plot): ia, ib, ic
+        self.current_ts = RingBuffer(MAX_CURRENT_POINTS, dtype=np.float64)
+        self.current_buf = RingBuffer(MAX_CURRENT_POINTS, channels=3)
+        # Filtered Park's vector (longer buffer for pattern): id, iq
+        self.parks_buf = RingBuffer(2*MAX_CURRENT_POINTS, channels=2)
+        # Payload handed to the details page (see plot_data)
+        self._plot_data = {}
         
         # Thread-safe ingress for high-rate data coming from BLE callback thread.
-        # We poll and drain this queue on the Tk thread to avoid Tkinter cross-thread calls.
-        self._incoming = queue.Queue()
-        self._poll_interval_ms = 5  # lower = lower latency (more CPU). 5ms ~= 200Hz poll.
+        # Single producer (BLE thread appends), single consumer (Tk thread pops from
+        # the left): deque append/popleft are atomic, so no lock is needed, and the
+        # Tk thread drains in one batch, avoiding Tkinter cross-thread calls.
+        # Bounded: if the GUI stalls, each append drops the oldest sample, so
+        # memory and catch-up work stay capped and the freshest data survives.
+        self._pending = deque(maxlen=MAX_DRAIN_SAMPLES)
+        self._poll_interval_ms = 16  # ~60Hz, the plot refresh rate.
 
         # Setup UI
         self._setup_styles()
@@ -196,6 +225,7 @@ class MotorApp(tk.Tk):
     def show_frame(self, page_name):
         """Switch to a different page"""
         frame = self.frames[page_name]
+        self.current_frame = frame
         frame.tkraise()
         if hasattr(frame, "on_show"):
             frame.on_show()
@@ -205,12 +235,15 @@ class MotorApp(tk.Tk):
     # ------------------------------------------------------------------------
 
     def _tick_clock(self):
-        """Update clock displays on all pages (called every 200ms)"""
+        """Update clock displays on all pages (called at the start of every minute)"""
         now = datetime.now()
         for frame in self.frames.values():
             if hasattr(frame, "set_clock"):
                 frame.set_clock(now)
-        self.after(200, self._tick_clock)
+        # The clock shows hours and minutes only, so sleep until the next minute
+        # (plus a little slack so the timer can't fire just before it)
+        ms_to_next_minute = (60 - now.second) * 1000 - now.microsecond // 1000
+        self.after(ms_to_next_minute + 50, self._tick_clock)
 
     # ------------------------------------------------------------------------
     # BLE DATA INTEGRATION
@@ -254,171 +287,178 @@ class MotorApp(tk.Tk):
         - filtered_id, filtered_iq: Filtered Park's vector
         """
         # Called from BLE callback thread. Do NOT touch Tk here.
-        try:
-            self._incoming.put_nowait(
-                (timestamp, ax, ay, az, temp, ia, ib, ic, id_val, iq_val, filtered_id, filtered_iq)
-            )
-        except Exception:
-            # If queueing fails, drop the sample (prefer freshness over backlog).
-            pass
+        self._pending.append((timestamp, ax, ay, az, temp, ia, ib, ic,
+                              id_val, iq_val, filtered_id, filtered_iq))
 
     def _poll_incoming(self):
         """
         Drain queued samples and update plots.
         Runs on the Tk main thread on a short timer to minimize latency.
         """
-        drained_any = False
-        latest = None
-        processed = 0
-
-        # Drain all queued samples and update buffers for each.
-        while True:
-            try:
-                item = self._incoming.get_nowait()
-            except queue.Empty:
-                break
-
-            drained_any = True
-            latest = item
-            self._process_data_point(*item)
-            processed += 1
-
-            # If the queue explodes (GUI can't keep up), drop older samples and keep freshness.
-            if processed > 500:
-                while True:
-                    try:
-                        latest = self._incoming.get_nowait()
-                    except queue.Empty:
-                        break
-                if latest is not None:
-                    self._process_data_point(*latest)
-                break
-
-        # Redraw once per poll cycle to prevent backlog / lag.
-        if drained_any:
+        # Only the samples queued so far; anything appended meanwhile waits for the
+        # next poll. Appends never shrink the deque (a full one evicts from the left
+        # as it adds), so the n pops below always find a sample.
+        pending = self._pending
+        n = len(pending)
+        batch = [pending.popleft() for _ in range(n)]
+
+        # Process the batch and redraw once per poll cycle to prevent backlog / lag.
+        if batch:
+            self._process_batch(batch)
             self._update_plots()
 
         self.after(self._poll_interval_ms, self._poll_incoming)
     
-    def _process_data_point(self, timestamp, ax, ay, az, temp, ia, ib, ic,
-                            id_val, iq_val, filtered_id, filtered_iq):
-        """Process incoming data point on main GUI thread"""
-        warnings = []
-
-        # Add data to buffers (deque auto-removes old data)
-        self.data_buffers['accel_ts'].append(timestamp)
-        self.data_buffers['accel_x'].append(ax)
-        self.data_buffers['accel_y'].append(ay)
-        self.data_buffers['accel_z'].append(az)
-        self.data_buffers['temp_ts'].append(timestamp)
-        self.data_buffers['temp_vals'].append(temp)
+    def _process_batch(self, batch):
+        """
+        Process a batch of incoming samples on main GUI thread.
+        Buffers and signal statistics are updated with one array operation per
+        series; only the warning state machines step through the samples.
+        """
+        # Columns: timestamp, ax, ay, az, temp, ia, ib, ic, id, iq, filtered_id, filtered_iq
+        arr = np.array(batch, dtype=np.float64)
+        ts = arr[:, 0]
+
+        # Add data to ring buffers (oldest samples are overwritten when full)
+        self.accel_temp_ts.extend(ts)
+        self.accel_temp_buf.extend(arr[:, 1:5])
         # Add 3-phase currents for time-domain plot
-        self.data_buffers['current_ts'].append(timestamp)
-        self.data_buffers['ia'].append(ia)
-        self.data_buffers['ib'].append(ib)
-        self.data_buffers['ic'].append(ic)
+        self.current_ts.extend(ts)
+        self.current_buf.extend(arr[:, 5:8])
         # Add filtered Park's vector
-        self.data_buffers['filtered_id'].append(filtered_id)
-        self.data_buffers['filtered_iq'].append(filtered_iq)
+        self.parks_buf.extend(arr[:, 10:12])
         
         # Update motor status
-        if len(self.data_buffers['accel_x']) > 0:
-            self.motor_state['status'] = 'Good'
-            self.motor_state['status_detail'] = 'Running Normally'
-
-        # Update warning if temperature is above threshold
-        temp_threshold = ROOM_TEMP_C + TEMP_WARN_DELTA_C
-        if temp > temp_threshold:
-            if not self._temp_warning_active:
-                warnings.append(
-                    f"High temperature detected: {temp:.1f}°C "
-                    f"(>{temp_threshold:.0f}°C threshold)"
-                )
-                self._temp_warning_active = True
-        elif temp < temp_threshold - TEMP_WARN_HYST_C:
-            self._temp_warning_active = False
+        self.motor_state['status'] = 'Good'
+        self.motor_state['status_detail'] = 'Running Normally'
 
         # --- Vibration (acceleration) monitoring ---
-        accel_mag = math.sqrt(ax * ax + ay * ay + az * az)
-        self._accel_mag_buf.append(accel_mag)
-
-        # Learn baseline when the motor is clearly running
-        if not self._vibe_baseline_ready:
-            if len(self._accel_mag_buf) >= ACCEL_BASELINE_SAMPLES:
-                recent = list(self._accel_mag_buf)[-ACCEL_BASELINE_SAMPLES:]
-                rms_recent = math.sqrt(sum(m * m for m in recent) / len(recent))
-                if rms_recent > ACCEL_RUN_MAG_THRESHOLD:
-                    mean_recent = sum(recent) / len(recent)
-                    var_recent = sum((m - mean_recent) ** 2 for m in recent) / len(recent)
-                    std_recent = math.sqrt(var_recent)
-                    self._vibe_baseline_mean = mean_recent
-                    self._vibe_baseline_std = max(std_recent, 1e-6)
-                    self._vibe_baseline_ready = True
-                    self._vibe_consec_high = 0
-                    self._vibe_consec_clear = 0
-        else:
-            if len(self._accel_mag_buf) >= ACCEL_WINDOW_SAMPLES:
-                window = list(self._accel_mag_buf)[-ACCEL_WINDOW_SAMPLES:]
-                rms_window = math.sqrt(sum(m * m for m in window) / len(window))
-
-                # Threshold: baseline + N·σ (with a small floor), tuned for higher sensitivity
-                threshold = self._vibe_baseline_mean + max(ACCEL_FLOOR_G, ACCEL_SIGMA_MULTIPLIER * self._vibe_baseline_std)
-
-                if rms_window > threshold:
-                    self._vibe_consec_high += 1
-                    self._vibe_consec_clear = 0
-                else:
-                    self._vibe_consec_clear += 1
-                    self._vibe_consec_high = 0
-
-                if self._vibe_consec_high >= 2:
+        ax, ay, az = arr[:, 1], arr[:, 2], arr[:, 3]
+        accel_mag = np.sqrt(ax * ax + ay * ay + az * az)
+
+        # Window statistics at each new sample come from prefix sums over the
+        # previous samples followed by the batch. The zero padding only feeds
+        # windows that are not full yet, which the checks below never read.
+        mag_buf = self._accel_mag_buf
+        n_before = len(mag_buf)
+        prev = mag_buf.last(ACCEL_BASELINE_SAMPLES)
+        ext = np.concatenate((np.zeros(ACCEL_BASELINE_SAMPLES + 1 - len(prev)), prev, accel_mag))
+        mag_buf.extend(accel_mag)
+        k = len(accel_mag)
+        e0 = ACCEL_BASELINE_SAMPLES + 1    # index of the first new sample
+        csq = np.cumsum(ext * ext)
+
+        def window_sums(csum, n):
+            return csum[e0:] - csum[e0 - n:e0 - n + k]
+
+        win_rms = np.sqrt(window_sums(csq, ACCEL_WINDOW_SAMPLES) / ACCEL_WINDOW_SAMPLES).tolist()
+        base_stats = None   # (mean, rms, std) per sample, only needed while learning
+
+        temps = arr[:, 4].tolist()
+
+        for i in range(k):
+            warnings = []
+            n_avail = n_before + i + 1
+
+            # Update warning if temperature is above threshold
+            temp = temps[i]
+            if temp > TEMP_WARN_THRESHOLD_C:
+                if not self._temp_warning_active:
                     warnings.append(
-                        f"High vibration: RMS {rms_window:.3f} g "
-                        f"(baseline {self._vibe_baseline_mean:.3f} g)"
+                        f"High temperature detected: {temp:.1f}°C "
+                        f"(>{TEMP_WARN_THRESHOLD_C:.0f}°C threshold)"
                     )
-
-                # If vibration falls well below run threshold for a while, reset baseline (motor likely off)
-                if self._vibe_consec_clear >= 20 and rms_window < ACCEL_RUN_MAG_THRESHOLD / 2:
-                    self._vibe_baseline_ready = False
-                    self._vibe_consec_high = 0
-                    self._vibe_consec_clear = 0
-
-        # Record warnings with timestamps so they persist in UI
-        if warnings:
+                    self._temp_warning_active = True
+            elif temp < TEMP_WARN_THRESHOLD_C - TEMP_WARN_HYST_C:
+                self._temp_warning_active = False
+
+            # Learn baseline when the motor is clearly running
+            if not self._vibe_baseline_ready:
+                if n_avail >= ACCEL_BASELINE_SAMPLES:
+                    if base_stats is None:
+                        mean = window_sums(np.cumsum(ext), ACCEL_BASELINE_SAMPLES) / ACCEL_BASELINE_SAMPLES
+                        mean_sq = window_sums(csq, ACCEL_BASELINE_SAMPLES) / ACCEL_BASELINE_SAMPLES
+                        base_stats = (mean.tolist(), np.sqrt(mean_sq).tolist(),
+                                      np.sqrt(np.maximum(mean_sq - mean * mean, 0.0)).tolist())
+                    base_mean, base_rms, base_std = base_stats
+                    if base_rms[i] > ACCEL_RUN_MAG_THRESHOLD:
+                        self._vibe_baseline_mean = base_mean[i]
+                        self._vibe_baseline_std = max(base_std[i], 1e-6)
+                        # Threshold: baseline + N·σ (with a small floor), tuned for higher sensitivity
+                        self._vibe_threshold = self._vibe_baseline_mean + max(
+                            ACCEL_FLOOR_G, ACCEL_SIGMA_MULTIPLIER * self._vibe_baseline_std)
+                        self._vibe_baseline_ready = True
+                        self._vibe_consec_high = 0
+                        self._vibe_consec_clear = 0
+            else:
+                if n_avail >= ACCEL_WINDOW_SAMPLES:
+                    rms_window = win_rms[i]
+
+                    if rms_window > self._vibe_threshold:
+                        self._vibe_consec_high += 1
+                        self._vibe_consec_clear = 0
+                    else:
+                        self._vibe_consec_clear += 1
+                        self._vibe_consec_high = 0
+
+                    if self._vibe_consec_high >= 2:
+                        warnings.append(
+                            f"High vibration: RMS {rms_window:.3f} g "
+                            f"(baseline {self._vibe_baseline_mean:.3f} g)"
+                        )
+
+                    # If vibration falls well below run threshold for a while, reset baseline (motor likely off)
+                    if self._vibe_consec_clear >= 20 and rms_window < ACCEL_RUN_MAG_THRESHOLD / 2:
+                        self._vibe_baseline_ready = False
+                        self._vibe_consec_high = 0
+                        self._vibe_consec_clear = 0
+
+            # Record warnings with timestamps so they persist in UI
             for msg in warnings:
                 self._add_warning_event(msg)
+
+        # The active warning is the one raised by the newest sample
         self.motor_state["warning"] = " | ".join(warnings)
     
+    def plot_data(self):
+        """Time-ordered views of the ring buffers, in the dict the plots read"""
+        # Columns are passed straight to matplotlib. The dict itself is reused;
+        # only its values (fresh views) change between redraws.
+        accel_temp_ts = self.accel_temp_ts.view()
+        accel_temp = self.accel_temp_buf.view()
+        current = self.current_buf.view()
+        parks = self.parks_buf.view()
+        data = self._plot_data
+        # 3-phase currents over time
+        data['current_ts'] = self.current_ts.view()
+        data['ia'] = current[:, 0]
+        data['ib'] = current[:, 1]
+        data['ic'] = current[:, 2]
+        # Filtered Park's vector
+        data['filtered_id'] = parks[:, 0]
+        data['filtered_iq'] = parks[:, 1]
+        # Acceleration and temperature
+        data['accel_ts'] = accel_temp_ts
+        data['accel_x'] = accel_temp[:, 0]
+        data['accel_y'] = accel_temp[:, 1]
+        data['accel_z'] = accel_temp[:, 2]
+        data['accel_xyz'] = accel_temp[:, :3]
+        data['temp_ts'] = accel_temp_ts
+        data['temp_vals'] = accel_temp[:, 3]
+        return data
+
     def _update_plots(self):
         """Push buffered data to plots"""
-        # Convert deques to lists for plotting
-        data = {
-            # 3-phase currents over time
-            'current_ts': list(self.data_buffers['current_ts']),
-            'ia': list(self.data_buffers['ia']),
-            'ib': list(self.data_buffers['ib']),
-            'ic': list(self.data_buffers['ic']),
-            # Filtered Park's vector
-            'filtered_id': list(self.data_buffers['filtered_id']),
-            'filtered_iq': list(self.data_buffers['filtered_iq']),
-            # Acceleration and temperature
-            'accel_ts': list(self.data_buffers['accel_ts']),
-            'accel_x': list(self.data_buffers['accel_x']),
-            'accel_y': list(self.data_buffers['accel_y']),
-            'accel_z': list(self.data_buffers['accel_z']),
-            'temp_ts': list(self.data_buffers['temp_ts']),
-            'temp_vals': list(self.data_buffers['temp_vals']),
-        }
-        
-        # Update plots on details page
+        # Update plots on details page. Nothing is built while it is hidden;
+        # it pulls the latest data itself when shown (see on_show).
         details = self.frames["MotorDetailsPage"]
-        if hasattr(details, "update_plots_from_data"):
-            details.update_plots_from_data(data)
+        if self.current_frame is details:
+            details.update_plots_from_data(self.plot_data())
         
-        # Refresh status labels
-        for frame in self.frames.values():
-            if hasattr(frame, "refresh"):
-                frame.refresh()
+        # Refresh status labels of the visible page; the other one catches
+        # up in its on_show
+        if hasattr(self.current_frame, "refresh"):
+            self.current_frame.refresh()
 
     def _add_warning_event(self, message: str):
         """Store warning with timestamp for UI display"""
@@ -431,27 +471,36 @@ class MotorApp(tk.Tk):
 
     def create_nasa_logo(self, parent):
         """Load NASA logo from assets (scaled down to fit header)"""
-        logo_path = os.path.join(self._asset_dir, "nasalogo.png")
-        if os.path.exists(logo_path):
-            # Keep a reference to prevent garbage collection
-            img = tk.PhotoImage(file=logo_path)
-
-            # Downscale if larger than our max bounds
-            try:
-                w, h = img.width(), img.height()
-                if w > LOGO_MAX_W or h > LOGO_MAX_H:
-                    factor = max(w / LOGO_MAX_W, h / LOGO_MAX_H)
-                    factor = max(1, math.ceil(factor))
-                    img = img.subsample(factor, factor)
-            except Exception:
-                pass
-
-            self._nasa_logo_img = img
-            lbl = tk.Label(parent, image=self._nasa_logo_img, bg=parent.cget("background"))
-            return lbl
+        bg = parent.cget("background")
+        img = self._load_nasa_logo()
+        if img is not None:
+            return tk.Label(parent, image=img, bg=bg)
         else:
             # Fallback: text placeholder if asset missing
-            return tk.Label(parent, text="NASA Ames", bg=parent.cget("background"), fg=COLORS["primary"])
+            return tk.Label(parent, text="NASA Ames", bg=bg, fg=COLORS["primary"])
+
+    def _load_nasa_logo(self):
+        """Decode and scale the logo once; every page header shares the same image"""
+        if self._nasa_logo_img is not None:
+            return self._nasa_logo_img
+        logo_path = os.path.join(self._asset_dir, "nasalogo.png")
+        if not os.path.exists(logo_path):
+            return None
+        img = tk.PhotoImage(file=logo_path)
+
+        # Downscale if larger than our max bounds
+        try:
+            w, h = img.width(), img.height()
+            if w > LOGO_MAX_W or h > LOGO_MAX_H:
+                factor = max(w / LOGO_MAX_W, h / LOGO_MAX_H)
+                factor = max(1, math.ceil(factor))
+                img = img.subsample(factor, factor)
+        except Exception:
+            pass
+
+        # Keep a reference to prevent garbage collection
+        self._nasa_logo_img = img
+        return img
 
 
 # ============================================================================
@@ -467,6 +516,8 @@ class DashboardPage(ttk.Frame):
     def __init__(self, parent, controller: MotorApp):
         super().__init__(parent, style="Container.TFrame")
         self.controller = controller
+        # Label values currently on screen (see refresh)
+        self._last_shown = None
         
         # Create header
         self._create_header()
@@ -620,29 +671,37 @@ class DashboardPage(ttk.Frame):
         """Update clock display"""
         self.clock_lbl.config(text=now.strftime("%I:%M %p  |  %b %d, %Y"))
 
+    def on_show(self):
+        """Called when page is shown"""
+        self.refresh()
+
     def refresh(self):
         """Update displayed values from motor_state"""
         st = self.controller.motor_state
         
-        # Update status text
+        # Status text
         status_text = st['status']
         if st["status_detail"]:
             status_text += f" — {st['status_detail']}"
-        self.status_lbl.config(text=status_text)
+        # Status badge color
+        badge_fg = STATUS_BADGE_FG.get(st['status'], COLORS["gray_dark"])
+        # Power
+        power_text = "—" if st["power_kw"] is None else f"{st['power_kw']} kW"
         
-        # Update status badge color
-        if st['status'] == "Good":
-            self.status_badge.config(fg=COLORS["success"])
-        elif st['status'] == "Fault":
-            self.status_badge.config(fg=COLORS["danger"])
-        else:
-            self.status_badge.config(fg=COLORS["gray_dark"])
+        # refresh() runs on every plot update; skip the Tk calls unless
+        # something on screen actually changes
+        shown = (status_text, badge_fg, power_text)
+        last = self._last_shown
+        if shown == last:
+            return
+        self._last_shown = shown
         
-        # Update power
-        if st["power_kw"] is None:
-            self.power_lbl.config(text="—")
-        else:
-            self.power_lbl.config(text=f"{st['power_kw']} kW")
+        if last is None or status_text != last[0]:
+            self.status_lbl.config(text=status_text)
+        if last is None or badge_fg != last[1]:
+            self.status_badge.config(fg=badge_fg)
+        if last is None or power_text != last[2]:
+            self.power_lbl.config(text=power_text)
 
 
 # ============================================================================
@@ -666,9 +725,47 @@ class MotorDetailsPage(ttk.Frame):
         self.accel_freq_domain = False  # False = time, True = frequency
         self.accel_data_cache = {}      # For toggling domains
         
+        # Label values currently on screen (see refresh)
+        self._last_shown = None
+        
+        # Persistent plot artists, created when the first data replaces the placeholders
+        self.current_lines = None
+        self.accel_lines = None
+        self._accel_domain_drawn = None
+        self._accel_mag = None          # FFT magnitude buffer for the spectrum view
+        self._accel_hann = None         # (N, 1) Hann window for the spectrum
+        self._accel_spectrum_key = None # (length, newest timestamp) the spectrum was computed for
+        self._accel_freqs = None
+        self._accel_bg = None           # Cached spectrum background (blitting)
+        self._accel_lims = None         # (max frequency, max magnitude) of that background
+        self.temp_line = None
+        self.temp_fill = None
+        self.temp_threshold = None
+        
+        # Blitting state for the scrolling currents and temperature plots
+        self._currents_bg = None
+        self._currents_xlim = None
+        self._temp_bg = None
+        self._temp_lims = None          # (x limits, y-axis centre) of that background
+        
+        # Redraw coalescing (see update_plots_from_data)
+        self._pending_data = None
+        self._redraw_scheduled = False
+        self._stale_plots = set()       # Plots that haven't drawn the latest data yet
+        self._last_plot_draw = dict.fromkeys(PLOT_MIN_INTERVAL_S, 0.0)
+        
+        # Blitting state for the filtered Park's vector plot
+        self.parks_scatter = None       # Animated trajectory artist, created on first data
+        self._parks_bg = None           # Cached background (everything but the trajectory)
+        self._parks_lim = PARKS_PLOT_LIM
+        
         # Create UI
         self._create_header()
         self._create_main_layout()
+        self.canvas2.mpl_connect("draw_event", self._on_parks_draw)
+        self.canvas3.mpl_connect("draw_event", self._on_accel_draw)
+        self.canvas1.mpl_connect("draw_event", self._on_currents_draw)
+        self.canvas4.mpl_connect("draw_event", self._on_temp_draw)
         
         # Show placeholders until data arrives
         self._show_placeholder_plots()
@@ -922,59 +1019,87 @@ class MotorDetailsPage(ttk.Frame):
     def update_plots_from_data(self, data: dict):
         """
         Update all plots with new data from buffers.
-        Called by MotorApp._update_plots() at 60Hz.
+        Called by MotorApp._update_plots() at up to 60Hz.
+        
+        Redraws are coalesced: the newest data replaces any pending data, and
+        at most one redraw runs per REDRAW_INTERVAL_MS, when Tk is idle. Each
+        plot additionally redraws at most once per PLOT_MIN_INTERVAL_S.
         
         EXPECTED DATA KEYS:
         - current_ts, ia, ib, ic: 3-phase currents
         - filtered_id, filtered_iq: Filtered Park's vector
         - accel_ts, accel_x, accel_y, accel_z: Acceleration data
+          (plus accel_xyz, the same three axes as one (N, 3) array)
         - temp_ts, temp_vals: Temperature data
         """
+        self._pending_data = data
+        self._stale_plots.update(PLOT_MIN_INTERVAL_S)
+        # Pages are stacked in one grid cell, so a hidden page is still mapped;
+        # while the dashboard is on top, don't redraw (on_show catches up)
+        if self.controller.current_frame is not self:
+            return
+        if not self._redraw_scheduled:
+            self._redraw_scheduled = True
+            self.after_idle(self._do_redraw)
+
+    def _redraw_done(self):
+        """End of the redraw interval; pick up data that arrived meanwhile"""
+        self._redraw_scheduled = False
+        # Throttled plots stay stale until their interval has passed, so this
+        # also catches them up after the data stops
+        if self._stale_plots and self.controller.current_frame is self:
+            self._redraw_scheduled = True
+            self.after_idle(self._do_redraw)
+
+    def _do_redraw(self):
+        """Redraw the stale plots whose throttle interval has passed"""
+        data = self._pending_data
+        self.after(REDRAW_INTERVAL_MS, self._redraw_done)
+        
+        now = time.monotonic()
+        due = {plot for plot in self._stale_plots
+               if now - self._last_plot_draw[plot] >= PLOT_MIN_INTERVAL_S[plot]}
+        self._stale_plots -= due
+        for plot in due:
+            self._last_plot_draw[plot] = now
         
         # Plot 1: 3-Phase Currents over Time
-        if all(k in data for k in ("current_ts", "ia", "ib", "ic")):
+        if "currents" in due and all(k in data for k in ("current_ts", "ia", "ib", "ic")):
             self._update_currents_plot(data)
         
         # Plot 2: Filtered Park's Vector
-        if "filtered_id" in data and "filtered_iq" in data:
+        if "parks" in due and "filtered_id" in data and "filtered_iq" in data:
             self._update_filtered_parks_plot(data)
         
         # Plot 3: Acceleration (time or frequency domain)
-        if all(k in data for k in ("accel_ts", "accel_x", "accel_y", "accel_z")):
-            self.accel_data_cache = {
-                "accel_ts": data["accel_ts"],
-                "accel_x": data["accel_x"],
-                "accel_y": data["accel_y"],
-                "accel_z": data["accel_z"]
-            }
-            self._plot_accel_data(self.accel_data_cache)
+        if "accel" in due and all(k in data for k in ("accel_ts", "accel_x", "accel_y",
+                                                      "accel_z", "accel_xyz")):
+            # The values are array views of the ring buffers, so keep the
+            # data dict itself for domain toggling instead of rebuilding one
+            self.accel_data_cache = data
+            self._plot_accel_data(data)
         
         # Plot 4: Temperature
-        if "temp_ts" in data and "temp_vals" in data:
+        if "temp" in due and "temp_ts" in data and "temp_vals" in data:
             self._update_temperature_plot(data)
 
-    def _update_currents_plot(self, data):
-        """Update 3-phase currents plot (ia, ib, ic vs time)"""
+    def _init_currents_plot(self):
+        """Set up the static parts of the 3-phase currents plot and its persistent lines"""
         self.ax1.clear()
         self.ax1.set_title("3-Phase Currents (ia, ib, ic)", fontsize=11, 
                           fontweight='bold', color=COLORS["primary"], pad=10)
         self.ax1.set_facecolor(COLORS["gray_light"])
         
-        # Check if we have data
-        if len(data["current_ts"]) > 0 and len(data["ia"]) > 0:
-            # Plot all three phase currents
-            self.ax1.plot(data["current_ts"], data["ia"],
-                         linewidth=2, color="#ef4444", label="ia", alpha=0.9)
-            self.ax1.plot(data["current_ts"], data["ib"],
-                         linewidth=2, color="#10b981", label="ib", alpha=0.9)
-            self.ax1.plot(data["current_ts"], data["ic"],
-                         linewidth=2, color="#3b82f6", label="ic", alpha=0.9)
-            
-            self.ax1.legend(loc="upper right", fontsize=9, framealpha=0.9)
-        else:
-            self.ax1.text(0.5, 0.5, "Waiting for current data...",
-                         ha="center", va="center", transform=self.ax1.transAxes,
-                         fontsize=10, color=COLORS["gray_dark"])
+        # Lines and legend are blitted over the cached background
+        self.current_lines = (
+            self.ax1.plot([], [], linewidth=2, color="#ef4444", label="ia", alpha=0.9,
+                          animated=True)[0],
+            self.ax1.plot([], [], linewidth=2, color="#10b981", label="ib", alpha=0.9,
+                          animated=True)[0],
+            self.ax1.plot([], [], linewidth=2, color="#3b82f6", label="ic", alpha=0.9,
+                          animated=True)[0],
+        )
+        self.ax1.legend(loc="upper right", fontsize=9, framealpha=0.9).set_animated(True)
         
         self.ax1.set_xlabel("time (s)", fontsize=9, color=COLORS["gray_dark"])
         self.ax1.set_ylabel("Current (A)", fontsize=9, color=COLORS["gray_dark"])
@@ -982,26 +1107,69 @@ class MotorDetailsPage(ttk.Frame):
         self.ax1.set_ylim(-3, 3)
         self.ax1.grid(True, alpha=0.2, color=COLORS["gray_dark"])
         self.ax1.tick_params(colors=COLORS["gray_dark"], labelsize=8)
-        self.canvas1.draw()
 
-    def _update_filtered_parks_plot(self, data):
+    def _update_currents_plot(self, data):
+        """Update 3-phase currents plot (ia, ib, ic vs time)"""
+        # Keep the placeholder until there is data to show
+        if len(data["current_ts"]) == 0:
+            return
+        if self.current_lines is None:
+            self._init_currents_plot()
+        
+        ts = data["current_ts"]
+        # At most one min/max pair per horizontal pixel, keeping the waveform envelope
+        width = int(self.ax1.bbox.width)
+        for line, key in zip(self.current_lines, ("ia", "ib", "ic")):
+            line.set_data(*min_max(ts, data[key], width))
+        
+        # The current axis stays fixed at +/-3 A. The time axis jumps ahead
+        # by SCROLL_LOOKAHEAD of the window when the newest sample reaches its
+        # right edge; between jumps only the lines are blitted.
+        xlim = self._currents_xlim
+        if self._currents_bg is None or ts[-1] > xlim[1] or ts[0] < xlim[0]:
+            self._currents_xlim = self._scroll_xlim(ts)
+            self.ax1.set_xlim(*self._currents_xlim)
+            # draw_event handler re-captures the background and draws the lines
+            self._currents_bg = None
+            self.canvas1.draw_idle()
+        else:
+            self.canvas1.restore_region(self._currents_bg)
+            self._draw_currents_animated()
+            self.canvas1.blit(self.ax1.bbox)
+
+    @staticmethod
+    def _scroll_xlim(ts):
+        """Time-axis limits from the oldest sample to a bit past the newest"""
+        span = max(ts[-1] - ts[0], 1e-3)
+        return ts[0], ts[-1] + SCROLL_LOOKAHEAD * span
+
+    def _draw_currents_animated(self):
+        """Draw the current lines, then the legend on top of them"""
+        for line in self.current_lines:
+            self.ax1.draw_artist(line)
+        self.ax1.draw_artist(self.ax1.get_legend())
+
+    def _on_currents_draw(self, event):
+        """Re-capture the currents background after every full redraw (time jump, resize)"""
+        if self.current_lines is None:
+            return
+        self._currents_bg = self.canvas1.copy_from_bbox(self.ax1.bbox)
+        self._draw_currents_animated()
+
+    def _init_parks_plot(self):
         """
-        Update filtered Park's vector plot with fault threshold.
-
-        This plot shows the Park's vector trajectory after scaling (mean radius ~ 1).
-        No ODT is applied.
+        Draw the static parts of the filtered Park's vector plot (title, grid,
+        threshold circle) once. The trajectory itself is an animated artist
+        that is blitted over the cached background on every update.
         """
         self.ax2.clear()
         self.ax2.set_title("Filtered Park's Vector (Scaled Trajectory)", 
                           fontsize=10, fontweight='bold', 
                           color=COLORS["primary"], pad=10)
         self.ax2.set_facecolor(COLORS["gray_light"])
-        self.ax2.scatter(data["filtered_id"], data["filtered_iq"],
-                s=18, color=COLORS["secondary"], alpha=0.8)
         
         # Draw fault threshold circle (centered at origin)
         try:
-            from matplotlib.patches import Circle
             # After scaling, a healthy trajectory should be roughly radius ~1
             threshold_radius = 1.2
             circle = Circle((0, 0), threshold_radius, 
@@ -1022,83 +1190,249 @@ class MotorDetailsPage(ttk.Frame):
         self.ax2.grid(True, alpha=0.2, color=COLORS["gray_dark"])
         self.ax2.tick_params(colors=COLORS["gray_dark"], labelsize=8)
         
-        # Set equal aspect ratio for circular pattern visibility
-        self.ax2.set_aspect('equal', adjustable='datalim')
+        # Fixed limits keep the cached background valid between frames.
+        # Equal aspect ratio for circular pattern visibility (the box adapts,
+        # not the limits).
+        self.ax2.set_xlim(-self._parks_lim, self._parks_lim)
+        self.ax2.set_ylim(-self._parks_lim, self._parks_lim)
+        self.ax2.set_aspect('equal', adjustable='box')
         
-        self.canvas2.draw()
+        self.parks_scatter = self.ax2.scatter([], [], s=18, color=COLORS["secondary"],
+                                              alpha=0.8, animated=True)
+
+    def _on_parks_draw(self, event):
+        """Re-capture the Park's plot background after every full redraw (first draw, resize)"""
+        if self.parks_scatter is None:
+            return
+        self._parks_bg = self.canvas2.copy_from_bbox(self.ax2.bbox)
+        self.ax2.draw_artist(self.parks_scatter)
+
+    def _update_filtered_parks_plot(self, data):
+        """
+        Update filtered Park's vector plot with fault threshold.
+
+        This plot shows the Park's vector trajectory after scaling (mean radius ~ 1).
+        No ODT is applied.
+        """
+        fid = data["filtered_id"]
+        fiq = data["filtered_iq"]
+        
+        # Rescale (full redraw) only when the trajectory leaves the axes or
+        # shrinks well inside them; otherwise the limits stay fixed
+        extent = max(np.abs(fid).max(), np.abs(fiq).max()) if len(fid) else 0.0
+        lim = max(PARKS_PLOT_LIM, 1.1 * extent)
+        full_redraw = self.parks_scatter is None or self._parks_bg is None
+        if lim > self._parks_lim or lim < self._parks_lim / 2:
+            self._parks_lim = lim
+            full_redraw = True
+        
+        if self.parks_scatter is None:
+            self._init_parks_plot()
+        elif full_redraw:
+            self.ax2.set_xlim(-self._parks_lim, self._parks_lim)
+            self.ax2.set_ylim(-self._parks_lim, self._parks_lim)
+        
+        self.parks_scatter.set_offsets(np.column_stack((fid, fiq)))
+        
+        if full_redraw:
+            # draw_event handler re-captures the background and draws the
+            # trajectory; until that idle draw has run there is no valid
+            # background, so later frames keep requesting it (coalesced by Tk)
+            self._parks_bg = None
+            self.canvas2.draw_idle()
+        else:
+            self.canvas2.restore_region(self._parks_bg)
+            self.ax2.draw_artist(self.parks_scatter)
+            self.canvas2.blit(self.ax2.bbox)
+
+    def _init_accel_plot(self):
+        """Set up the acceleration plot's persistent lines and legend"""
+        self.ax3.clear()
+        self.ax3.set_facecolor(COLORS["gray_light"])
+        self.accel_lines = (
+            self.ax3.plot([], [], linewidth=1.5, color="#ef4444", label="X-axis", alpha=0.8)[0],
+            self.ax3.plot([], [], linewidth=1.5, color="#10b981", label="Y-axis", alpha=0.8)[0],
+            self.ax3.plot([], [], linewidth=1.5, color="#3b82f6", label="Z-axis", alpha=0.8)[0],
+        )
+        self.ax3.legend(loc="upper right", fontsize=8, framealpha=0.9)
+        self.ax3.grid(True, alpha=0.2, color=COLORS["gray_dark"])
+        self.ax3.tick_params(colors=COLORS["gray_dark"], labelsize=8)
+        self._accel_domain_drawn = None
 
     def _plot_accel_data(self, data):
         """Plot acceleration in time or frequency domain"""
-        self.ax3.clear()
+        if self.accel_lines is None:
+            self._init_accel_plot()
+        
+        # Titles and axis labels only change when the domain is toggled
+        if self._accel_domain_drawn != self.accel_freq_domain:
+            self._accel_domain_drawn = self.accel_freq_domain
+            # The spectrum is blitted over a cached background, so its lines
+            # (and the legend above them) are animated in that domain only
+            for artist in self.accel_lines + (self.ax3.get_legend(),):
+                artist.set_animated(self.accel_freq_domain)
+            self._accel_bg = None
+            # The spectrum pins its limits; the time series autoscales again
+            self.ax3.set_autoscale_on(not self.accel_freq_domain)
+            if self.accel_freq_domain:
+                self.ax3.set_title("Acceleration Spectrum (X, Y, Z)", fontsize=11,
+                                 fontweight='bold', color=COLORS["primary"], pad=10)
+                self.ax3.set_xlabel("frequency (Hz)", fontsize=9, color=COLORS["gray_dark"])
+                self.ax3.set_ylabel("magnitude", fontsize=9, color=COLORS["gray_dark"])
+            else:
+                self.ax3.set_title("Acceleration Data (X, Y, Z)", fontsize=11,
+                                 fontweight='bold', color=COLORS["primary"], pad=10)
+                self.ax3.set_xlabel("time (s)", fontsize=9, color=COLORS["gray_dark"])
+                self.ax3.set_ylabel("acceleration (g)", fontsize=9, color=COLORS["gray_dark"])
         
         if self.accel_freq_domain:
             # FREQUENCY DOMAIN (FFT)
-            import numpy as np
-            
             ts = data["accel_ts"]
-            dt = ts[1] - ts[0] if len(ts) > 1 else 0.01
-            
-            # Compute FFT for each axis
-            fft_x = np.fft.rfft(data["accel_x"])
-            fft_y = np.fft.rfft(data["accel_y"])
-            fft_z = np.fft.rfft(data["accel_z"])
-            freqs = np.fft.rfftfreq(len(data["accel_x"]), dt)
+            xyz = data["accel_xyz"]
+            n = len(xyz)
+            # Domain toggles and on_show replot data that may already have
+            # been transformed; the newest timestamp identifies the window
+            key = (n, ts[-1] if n else None)
+            if key != self._accel_spectrum_key:
+                self._accel_spectrum_key = key
+                dt = ts[1] - ts[0] if n > 1 else 0.01
+                if self._accel_hann is None or len(self._accel_hann) != n:
+                    self._accel_hann = np.hanning(n).astype(xyz.dtype)[:, None]
+                
+                # Compute FFT for all three axes in one call, down the columns
+                # of the Hann-windowed (N, 3) block (scipy.fft reuses cached
+                # plans for the repeated window length)
+                spec = scipy.fft.rfft(xyz * self._accel_hann, axis=0)
+                # Magnitudes go into a buffer reused while the window length is unchanged
+                if self._accel_mag is None or self._accel_mag.shape != spec.shape:
+                    self._accel_mag = np.empty(spec.shape, dtype=spec.real.dtype)
+                np.abs(spec, out=self._accel_mag)
+                self._accel_freqs = scipy.fft.rfftfreq(n, dt)
+            spectrum = self._accel_mag
+            freqs = self._accel_freqs
             
             # Plot magnitude spectrum
-            self.ax3.set_title("Acceleration Spectrum (X, Y, Z)", fontsize=11,
-                             fontweight='bold', color=COLORS["primary"], pad=10)
-            self.ax3.plot(freqs, np.abs(fft_x), linewidth=1.5, 
-                         color="#ef4444", label="X-axis", alpha=0.8)
-            self.ax3.plot(freqs, np.abs(fft_y), linewidth=1.5,
-                         color="#10b981", label="Y-axis", alpha=0.8)
-            self.ax3.plot(freqs, np.abs(fft_z), linewidth=1.5,
-                         color="#3b82f6", label="Z-axis", alpha=0.8)
-            self.ax3.set_xlabel("frequency (Hz)", fontsize=9, color=COLORS["gray_dark"])
-            self.ax3.set_ylabel("magnitude", fontsize=9, color=COLORS["gray_dark"])
+            for i, line in enumerate(self.accel_lines):
+                line.set_data(freqs, spectrum[:, i])
+            
+            # Keep the limits (and the cached background) until the spectrum
+            # outgrows them or shrinks well inside them, as for the Park's plot.
+            # The Nyquist frequency follows the sample spacing, which jitters
+            # from frame to frame, so both axes get some headroom.
+            fmax = freqs[-1]
+            peak = float(spectrum.max())
+            if (self._accel_bg is None
+                    or fmax > self._accel_lims[0] or fmax < self._accel_lims[0] / 1.5
+                    or peak > self._accel_lims[1] or peak < self._accel_lims[1] / 2):
+                self._accel_lims = (1.1 * fmax, max(1.1 * peak, 1e-6))
+                self.ax3.set_xlim(0, self._accel_lims[0])
+                self.ax3.set_ylim(0, self._accel_lims[1])
+                # draw_event handler re-captures the background and draws the lines
+                self._accel_bg = None
+                self.canvas3.draw_idle()
+            else:
+                self.canvas3.restore_region(self._accel_bg)
+                self._draw_accel_animated()
+                self.canvas3.blit(self.ax3.bbox)
         else:
-            # TIME DOMAIN
-            self.ax3.set_title("Acceleration Data (X, Y, Z)", fontsize=11,
-                             fontweight='bold', color=COLORS["primary"], pad=10)
-            self.ax3.plot(data["accel_ts"], data["accel_x"], linewidth=1.5,
-                         color="#ef4444", label="X-axis", alpha=0.8)
-            self.ax3.plot(data["accel_ts"], data["accel_y"], linewidth=1.5,
-                         color="#10b981", label="Y-axis", alpha=0.8)
-            self.ax3.plot(data["accel_ts"], data["accel_z"], linewidth=1.5,
-                         color="#3b82f6", label="Z-axis", alpha=0.8)
-            self.ax3.set_xlabel("time (s)", fontsize=9, color=COLORS["gray_dark"])
-            self.ax3.set_ylabel("acceleration (g)", fontsize=9, color=COLORS["gray_dark"])
-        
-        self.ax3.set_facecolor(COLORS["gray_light"])
-        self.ax3.legend(loc="upper right", fontsize=8, framealpha=0.9)
-        self.ax3.grid(True, alpha=0.2, color=COLORS["gray_dark"])
-        self.ax3.tick_params(colors=COLORS["gray_dark"], labelsize=8)
-        self.canvas3.draw()
-
-    def _update_temperature_plot(self, data):
-        """Update temperature over time plot"""
+            # TIME DOMAIN (the time axis scrolls every frame, so no blitting)
+            width = int(self.ax3.bbox.width)
+            for line, key in zip(self.accel_lines, ("accel_x", "accel_y", "accel_z")):
+                line.set_data(*min_max(data["accel_ts"], data[key], width))
+            
+            self.ax3.relim()
+            self.ax3.autoscale_view()
+            self.canvas3.draw_idle()
+
+    def _draw_accel_animated(self):
+        """Draw the spectrum lines, then the legend on top of them"""
+        for line in self.accel_lines:
+            self.ax3.draw_artist(line)
+        self.ax3.draw_artist(self.ax3.get_legend())
+
+    def _on_accel_draw(self, event):
+        """Re-capture the spectrum background after every full redraw (limits, resize)"""
+        if self.accel_lines is None or not self.accel_freq_domain:
+            return
+        self._accel_bg = self.canvas3.copy_from_bbox(self.ax3.bbox)
+        self._draw_accel_animated()
+
+    def _init_temperature_plot(self):
+        """Set up the static parts of the temperature plot and its persistent line"""
         self.ax4.clear()
         self.ax4.set_title("Temperature Over Time", fontsize=11,
                           fontweight='bold', color=COLORS["primary"], pad=10)
         self.ax4.set_facecolor(COLORS["gray_light"])
-        self.ax4.plot(data["temp_ts"], data["temp_vals"],
-                     linewidth=2, color="#f59e0b")
-        self.ax4.fill_between(data["temp_ts"], data["temp_vals"],
-                             alpha=0.3, color="#f59e0b")
+        # Everything on top of the grid is blitted over the cached background
+        self.temp_line, = self.ax4.plot([], [], linewidth=2, color="#f59e0b", animated=True)
+        # Area under the curve, as fill_between would draw it; its polygon is
+        # replaced in place on every update
+        self.temp_fill = PolyCollection([], alpha=0.3, facecolor="#f59e0b",
+                                        edgecolor="#f59e0b", animated=True)
+        self.ax4.add_collection(self.temp_fill, autolim=False)
         # Danger threshold line
-        temp_threshold = ROOM_TEMP_C + TEMP_WARN_DELTA_C
-        self.ax4.axhline(temp_threshold, color=COLORS["danger"], linestyle="--",
-                        linewidth=1.2, label=f"Threshold ({temp_threshold:.0f}°C)")
+        self.temp_threshold = self.ax4.axhline(
+            TEMP_WARN_THRESHOLD_C, color=COLORS["danger"], linestyle="--",
+            linewidth=1.2, label=f"Threshold ({TEMP_WARN_THRESHOLD_C:.0f}°C)",
+            animated=True)
         self.ax4.set_xlabel("time (s)", fontsize=9, color=COLORS["gray_dark"])
         self.ax4.set_ylabel("temperature (°C)", fontsize=9, color=COLORS["gray_dark"])
-        # Zoom y-axis around latest temp ±10°C for better detail
-        if data["temp_vals"]:
-            latest_temp = data["temp_vals"][-1]
-            self.ax4.set_ylim(latest_temp - 10, latest_temp + 10)
         # Show legend for threshold
-        self.ax4.legend(loc="upper right", fontsize=8, framealpha=0.9)
+        self.ax4.legend(loc="upper right", fontsize=8, framealpha=0.9).set_animated(True)
         self.ax4.grid(True, alpha=0.2, color=COLORS["gray_dark"])
         self.ax4.tick_params(colors=COLORS["gray_dark"], labelsize=8)
-        self.canvas4.draw()
+
+    def _update_temperature_plot(self, data):
+        """Update temperature over time plot"""
+        if self.temp_line is None:
+            self._init_temperature_plot()
+        
+        # No more points than the axes are pixels wide
+        ts, vals = lttb(data["temp_ts"], data["temp_vals"], int(self.ax4.bbox.width))
+        self.temp_line.set_data(ts, vals)
+        if len(ts) == 0:
+            self.temp_fill.set_verts([])
+            return
+        # Same polygon fill_between(ts, vals) builds: along the curve, then
+        # back along zero
+        verts = np.empty((len(ts) + 2, 2))
+        verts[:-2, 0] = ts
+        verts[:-2, 1] = vals
+        verts[-2:, 0] = ts[-1], ts[0]
+        verts[-2:, 1] = 0.0
+        self.temp_fill.set_verts([verts])
+        
+        # Zoom y-axis around latest temp ±10°C for better detail. The view is
+        # re-centred only when the latest temperature leaves its middle ±5°C,
+        # and the time axis jumps ahead as in the currents plot, so most
+        # updates just blit the curve.
+        latest_temp = data["temp_vals"][-1]
+        lims = self._temp_lims
+        if (self._temp_bg is None or ts[-1] > lims[0][1] or ts[0] < lims[0][0]
+                or abs(latest_temp - lims[1]) > 5):
+            self._temp_lims = (self._scroll_xlim(ts), latest_temp)
+            self.ax4.set_xlim(*self._temp_lims[0])
+            self.ax4.set_ylim(latest_temp - 10, latest_temp + 10)
+            # draw_event handler re-captures the background and draws the curve
+            self._temp_bg = None
+            self.canvas4.draw_idle()
+        else:
+            self.canvas4.restore_region(self._temp_bg)
+            self._draw_temp_animated()
+            self.canvas4.blit(self.ax4.bbox)
+
+    def _draw_temp_animated(self):
+        """Draw the fill, curve, threshold and legend in their stacking order"""
+        for artist in (self.temp_fill, self.temp_line, self.temp_threshold,
+                       self.ax4.get_legend()):
+            self.ax4.draw_artist(artist)
+
+    def _on_temp_draw(self, event):
+        """Re-capture the temperature background after every full redraw (rescale, resize)"""
+        if self.temp_line is None:
+            return
+        self._temp_bg = self.canvas4.copy_from_bbox(self.ax4.bbox)
+        self._draw_temp_animated()
 
     def _toggle_accel_domain(self):
         """Toggle between time and frequency domain for acceleration"""
@@ -1125,46 +1459,55 @@ class MotorDetailsPage(ttk.Frame):
     def on_show(self):
         """Called when page is shown"""
         self.refresh()
+        # Catch up with the data that arrived while the page was hidden
+        if len(self.controller.accel_temp_ts):
+            self.update_plots_from_data(self.controller.plot_data())
 
     def refresh(self):
         """Update status labels from motor_state"""
         st = self.controller.motor_state
-        self.title_lbl.config(text=f"{st['name']} Details")
+        title_text = f"{st['name']} Details"
         
-        # Update status bar with color
+        # Status bar with color
         status = st["status"]
-        if status == "Good":
-            bg, fg = COLORS["success"], COLORS["white"]
-        elif status == "Fault":
-            bg, fg = COLORS["danger"], COLORS["white"]
-        else:
-            bg, fg = COLORS["gray_light"], COLORS["primary"]
+        bg, fg = STATUS_BAR_COLORS.get(status, STATUS_BAR_DEFAULT)
         
         label_text = status
         if st["status_detail"]:
             label_text += f" — {st['status_detail']}"
-        self.status_bar.config(text=label_text, bg=bg, fg=fg)
-        
-        # Update power
-        if st["power_kw"] is None:
-            self.power_lbl.config(text="—")
-        else:
-            self.power_lbl.config(text=f"{st['power_kw']} kW")
+        status_bar = (label_text, bg, fg)
         
-        # Update configuration
-        self.config_lbl.config(text=st["configuration"])
+        # Power
+        power_text = "—" if st["power_kw"] is None else f"{st['power_kw']} kW"
 
-        # Update warning section
+        # Warning section
         active_warning = st.get("warning")
         if active_warning:
-            self.warning_lbl.config(text=active_warning, bg=COLORS["gray_light"])
+            warning = (active_warning, COLORS["gray_light"])
         elif self.controller._warning_history:
             ts, msg = self.controller._warning_history[-1]
-            self.warning_lbl.config(
-                text=f"Last warning @ {ts}: {msg}", bg=COLORS["white"]
-            )
+            warning = (f"Last warning @ {ts}: {msg}", COLORS["white"])
         else:
-            self.warning_lbl.config(text="No warnings yet", bg=COLORS["white"])
+            warning = ("No warnings yet", COLORS["white"])
+        
+        # refresh() runs on every plot update; skip the Tk calls unless
+        # something on screen actually changes
+        shown = (title_text, status_bar, power_text, st["configuration"], warning)
+        last = self._last_shown
+        if shown == last:
+            return
+        self._last_shown = shown
+        
+        if last is None or title_text != last[0]:
+            self.title_lbl.config(text=title_text)
+        if last is None or status_bar != last[1]:
+            self.status_bar.config(text=label_text, bg=bg, fg=fg)
+        if last is None or power_text != last[2]:
+            self.power_lbl.config(text=power_text)
+        if last is None or st["configuration"] != last[3]:
+            self.config_lbl.config(text=st["configuration"])
+        if last is None or warning != last[4]:
+            self.warning_lbl.config(text=warning[0], bg=warning[1])
 
 
 # ============================================================================
@@ -1,62 +1,88 @@
 import asyncio
+import math
 import struct
 import time
-import re
 import threading
-from collections import deque
 
 import numpy as np
 import serial
 from bleak import BleakScanner, BleakClient, BleakError
-import pandas as pd
-import os
+
+try:
+    # Optional faster event loop (Linux/macOS); plain asyncio otherwise
+    import uvloop
+except ImportError:
+    uvloop = None
 
 from fault import MotorFaultDetector
+from ring_buffer import RingBuffer
 
 DEVICE_NAME = "ESP32_1"
 CHAR_UUID = "488147e4-8512-4bca-b218-0b84f2f76853"
 
+# BLE payload: 4 little-endian floats (ax, ay, az, temp), compiled once
+IMU_STRUCT = struct.Struct("<4f")
+
 # ---------- Serial ----------
 SERIAL_PORT = "/dev/tty.usbserial-D306EM4X"
 BAUDRATE = 115200
 
 ser = None
 
-LINE_REGEX = re.compile(
-    r"ia:([-+]?\d*\.?\d+)\s+"
-    r"ib:([-+]?\d*\.?\d+)\s+"
-    r"ic:([-+]?\d*\.?\d+)"
-)
+# Binary frame from the ESP32: 2 sync bytes, then ia, ib, ic as float32,
+# then the low byte of the sum of those 12 payload bytes
+FRAME_SYNC = b"\xAA\x55"
+CURRENTS_STRUCT = struct.Struct("<3f")
 
 def open_serial(port: str, baud: int) -> serial.Serial:
     ser = serial.Serial(port, baud, timeout=0.1)  # short timeout
     time.sleep(1.5)
     return ser
 
-def parse_line(line: str):
-    m = LINE_REGEX.search(line)
-    if not m:
-        return None
-    return float(m.group(1)), float(m.group(2)), float(m.group(3))
-
-# Latest serial values updated by background thread
-latest_currents = {"ia": None, "ib": None, "ic": None, "t": None}
+# Latest serial values (ia, ib, ic, t), updated by background thread.
+# Replaced as a whole tuple, so readers always see a consistent sample.
+latest_currents = (None, None, None, None)
 
 def serial_reader_loop(ser: serial.Serial, stop_event: threading.Event):
-    """Continuously read serial lines and update latest_currents."""
+    """Continuously read serial frames and update latest_currents."""
+    global latest_currents
+    payload_start = len(FRAME_SYNC)
+    payload_end = payload_start + CURRENTS_STRUCT.size
+    frame_len = payload_end + 1
+    rx = bytearray()
     while not stop_event.is_set():
         try:
-            line = ser.readline().decode(errors="ignore").strip()
-            if not line:
-                continue
-            vals = parse_line(line)
+            # Drain everything the port has buffered in one call (block for
+            # at least one byte, up to the port timeout, when it's empty)
+            rx += ser.read(ser.in_waiting or 1)
+
+            # Walk the complete frames; only the newest one is published
+            vals = None
+            pos = 0
+            while True:
+                pos = rx.find(FRAME_SYNC, pos)
+                if pos < 0 or pos + frame_len > len(rx):
+                    break
+                # The sync bytes can also occur inside a payload; a frame
+                # that fails the checksum (or decodes to inf/NaN) is a false
+                # sync, so resume the search right after it
+                payload = rx[pos + payload_start:pos + payload_end]
+                if sum(payload) & 0xFF != rx[pos + payload_end]:
+                    pos += 1
+                    continue
+                frame = CURRENTS_STRUCT.unpack(payload)
+                if not all(map(math.isfinite, frame)):
+                    pos += 1
+                    continue
+                vals = frame
+                pos += frame_len
+
+            # Keep a trailing partial frame (or a possible first sync byte)
+            del rx[:pos if pos >= 0 else -1]
+
             if vals is None:
                 continue
-            ia, ib, ic = vals
-            latest_currents["ia"] = ia
-            latest_currents["ib"] = ib
-            latest_currents["ic"] = ic
-            latest_currents["t"] = time.time()
+            latest_currents = vals + (time.time(),)
         except Exception:
             # swallow serial parse errors
             continue
@@ -69,48 +95,159 @@ class GUIRegistry:
 gui_app = GUIRegistry()
 start_time = None
 
+def run_event_loop(coro):
+    if uvloop is not None:
+        return uvloop.run(coro)
+    return asyncio.run(coro)
+
 def run_data_acquisition():
     """
     Entry point used by motor_gui.py.
     Runs the BLE + serial acquisition loop in the calling thread.
     """
-    asyncio.run(main())
+    run_event_loop(main())
+
+# ---------- Console logging ----------
+# The BLE callback must return quickly, so it only hands the latest sample
+# to a bounded queue; log_worker prints from it at a fixed low rate.
+LOG_INTERVAL_S = 0.2
+log_queue = None
+
+def log_sample(ax, ay, az, temp, ia, ib, ic):
+    if log_queue is None:
+        return
+    sample = (ax, ay, az, temp, ia, ib, ic)
+    try:
+        log_queue.put_nowait(sample)
+    except asyncio.QueueFull:
+        # Drop the oldest entry so the worker always sees fresh data
+        log_queue.get_nowait()
+        log_queue.put_nowait(sample)
+
+async def log_worker(q: asyncio.Queue):
+    while True:
+        ax, ay, az, temp, ia, ib, ic = await q.get()
+        # Skip anything that queued up while we slept; only print the newest
+        while not q.empty():
+            ax, ay, az, temp, ia, ib, ic = q.get_nowait()
+
+        if ia is None or ib is None or ic is None:
+            print(f"IMU only: ax={ax:.3f} ay={ay:.3f} az={az:.3f} temp={temp:.2f}")
+        else:
+            print(
+                f"ax={ax:.3f}, ay={ay:.3f}, az={az:.3f}, temp={temp:.2f} | "
+                f"ia={ia:.3f}, ib={ib:.3f}, ic={ic:.3f}"
+            )
+        await asyncio.sleep(LOG_INTERVAL_S)
+
+# ---------- CSV recording ----------
+# The callback only appends raw rows to a list; csv_worker formats and
+# writes them in batches through one persistent, buffered file handle.
+CSV_PATH = "data.csv"
+CSV_FLUSH_INTERVAL_S = 0.5
+csv_rows = []
+
+def record_row(t, ia, ib, ic):
+    csv_rows.append((t, ia, ib, ic))
+
+def write_csv_rows(f):
+    global csv_rows
+    rows, csv_rows = csv_rows, []
+    f.writelines(
+        f"{t},,,\n" if ia is None or ib is None or ic is None else f"{t},{ia},{ib},{ic}\n"
+        for t, ia, ib, ic in rows
+    )
+    f.flush()
+
+async def csv_worker(path):
+    with open(path, "a", buffering=1 << 16) as f:
+        if f.tell() == 0:
+            f.write("time,ia,ib,ic\n")
+        try:
+            while True:
+                await asyncio.sleep(CSV_FLUSH_INTERVAL_S)
+                write_csv_rows(f)
+        finally:
+            write_csv_rows(f)
 
 # ---------- Fault detector ----------
 fault_detector = MotorFaultDetector(fs_target=3600, f0_target=60)
 
+# Park transform coefficients for the per-sample (scalar) path
+_C23 = math.sqrt(2 / 3)
+_INV_SQRT6 = 1.0 / math.sqrt(6)
+_INV_SQRT2 = 1.0 / math.sqrt(2)
+
+def direct_axis_current(i_a: float, i_b: float, i_c: float) -> float:
+    return _C23 * i_a - _INV_SQRT6 * (i_b + i_c)
+
+def quadrature_axis_current(i_b: float, i_c: float) -> float:
+    return _INV_SQRT2 * (i_b - i_c)
+
 BUFFER_SIZE = 200
-buf = {
-    "ia": deque(maxlen=BUFFER_SIZE),
-    "ib": deque(maxlen=BUFFER_SIZE),
-    "ic": deque(maxlen=BUFFER_SIZE),
-}
+# Recent phase currents in one preallocated ring, one (ia, ib, ic) row per
+# sample, so a push is a single write and all three means come from one sum
+ring_iabc = RingBuffer(BUFFER_SIZE, channels=3)
+
+# ---------- Window statistics ----------
+# The trajectory scale (1 / mean Park's vector modulus) needs the whole
+# buffered window. Rather than recomputing it on every BLE notification,
+# window_worker refreshes it at the GUI rate and the callback only reads
+# the cached value. Both run on the event loop thread, so they never
+# overlap: a slow refresh delays the next tick instead of queueing work,
+# and ticks with no new samples are skipped.
+WINDOW_INTERVAL_S = 1 / 60
+window_scale = 1.0
+window_dirty = False
+
+def update_window_stats():
+    global window_scale
+
+    if len(ring_iabc) == 0:
+        return
+
+    # The modulus mean doesn't depend on sample order, so use the ring
+    # as stored; the DC offsets come from its running sums and are
+    # removed inside the Park transform's single pass over the window
+    win = ring_iabc.window()
+    id_win, iq_win = fault_detector.compute_park_vector(
+        win[:, 0], win[:, 1], win[:, 2], offsets=ring_iabc.mean(),
+    )
+    r_mean = float(np.hypot(id_win, iq_win).mean(dtype=np.float64))
+    # scale_trajectory leaves the trajectory untouched when r_mean is 0
+    window_scale = 1.0 / r_mean if r_mean != 0 else 1.0
+
+async def window_worker():
+    global window_dirty
+    while True:
+        if window_dirty:
+            window_dirty = False
+            update_window_stats()
+        await asyncio.sleep(WINDOW_INTERVAL_S)
 
 def callback_handler(sender: int, data: bytearray):
     """BLE notification callback."""
-    global start_time, gui_app
+    global start_time, gui_app, window_dirty
 
+    # One clock read per notification; monotonic so wall-clock adjustments
+    # don't bend the timeline
+    now = time.monotonic()
     if start_time is None:
-        start_time = time.time()
+        start_time = now
 
-    t = time.time() - start_time
+    t = now - start_time
 
-    # 1) Confirm we are receiving notifications
-    print(f"BLE notify: {len(data)} bytes")
-
-    # 2) Decode BLE payload safely (don’t crash)
+    # 1) Decode BLE payload safely (don’t crash)
     ax = ay = az = temp = 0.0
     try:
         # Common case: 4 floats = 16 bytes (ax,ay,az,temp)
-        if len(data) >= 16:
-            ax, ay, az, temp = struct.unpack("<4f", data[:16])
+        if len(data) >= IMU_STRUCT.size:
+            ax, ay, az, temp = IMU_STRUCT.unpack_from(data)
     except Exception as e:
         print(f"⚠️ BLE unpack error: {e}")
 
-    # 3) Get latest serial currents without blocking BLE
-    ia = latest_currents["ia"]
-    ib = latest_currents["ib"]
-    ic = latest_currents["ic"]
+    # 2) Get latest serial currents without blocking BLE
+    ia, ib, ic, _ = latest_currents
 
     # if ia is None or ib is None or ic is None:
     #     return
@@ -118,16 +255,9 @@ def callback_handler(sender: int, data: bytearray):
     # if ia == 0.0 or ib == 0.0 or ic == 0.0:
     #     return
     
-    row_dict = {"time": [t], "ia": [ia], "ib": [ib], "ic": [ic]}
-    df = pd.DataFrame(row_dict)
-    
-    output_path = "data.csv"
-    df.to_csv(output_path, mode='a', index=False, header=not os.path.exists(output_path))
+    record_row(t, ia, ib, ic)
 
-    data = {"time": [t], "ia": [ia], "ib": [ib], "ic": [ic]}
-    # print(data)
-
-    # df = pd.DataFrame(data, columns=["time", "ia", "ib", "ic"])
+    # df = pd.DataFrame(row_dict, columns=["time", "ia", "ib", "ic"])
     # print(df)
 
     # dataframe to csv for current
@@ -139,24 +269,23 @@ def callback_handler(sender: int, data: bytearray):
     # df.to_csv(output_path, index=False)
     # df.to_csv(output_path, mode='a', header=not os.path.exists(output_path))
 
+    log_sample(ax, ay, az, temp, ia, ib, ic)
+
     if ia is None or ib is None or ic is None:
         # Serial not ready yet; still show IMU
-        print(f"IMU only: ax={ax:.3f} ay={ay:.3f} az={az:.3f} temp={temp:.2f}")
         return
 
-    print(
-        f"ax={ax:.3f}, ay={ay:.3f}, az={az:.3f}, temp={temp:.2f} | "
-        f"ia={ia:.3f}, ib={ib:.3f}, ic={ic:.3f}"
-    )
-
-    # 4) DC removal (critical for Park)
-    buf["ia"].append(ia)
-    buf["ib"].append(ib)
-    buf["ic"].append(ic)
+    # 3) DC removal (critical for Park)
+    ring_iabc.push((ia, ib, ic))
+    window_dirty = True
 
-    ia_ac = ia - float(np.mean(buf["ia"]))
-    ib_ac = ib - float(np.mean(buf["ib"]))
-    ic_ac = ic - float(np.mean(buf["ic"]))
+    # The ring keeps running sums, so the window means are O(1) here.
+    # tolist() keeps the scalar Park path on Python floats, which is
+    # several times cheaper than NumPy scalar arithmetic.
+    ia_mean, ib_mean, ic_mean = ring_iabc.mean().tolist()
+    ia_ac = ia - ia_mean
+    ib_ac = ib - ib_mean
+    ic_ac = ic - ic_mean
 
     # if ia_ac is None or ib_ac is None or ic_ac is None:
     #     return
@@ -178,30 +307,23 @@ def callback_handler(sender: int, data: bytearray):
     # output_path = "test3.csv"
     # df.to_csv(output_path, mode='a', index=False, header=not os.path.exists(output_path))
 
-    # 5) Park vector (and scaled trajectory) on DC-removed signals.
+    # 4) Park vector on DC-removed signals.
     # We intentionally do NOT run ODT or filtering here.
     #
-    # Compute Park's vector for the entire buffered window, then scale the
-    # trajectory, and take the most recent point for plotting.
-    ia_ac_win = np.array(buf["ia"], dtype=float) - float(np.mean(buf["ia"]))
-    ib_ac_win = np.array(buf["ib"], dtype=float) - float(np.mean(buf["ib"]))
-    ic_ac_win = np.array(buf["ic"], dtype=float) - float(np.mean(buf["ic"]))
-
-    id_win, iq_win = fault_detector.compute_park_vector(ia_ac_win, ib_ac_win, ic_ac_win)
-    id_scaled_win, iq_scaled_win = fault_detector.scale_trajectory(id_win, iq_win)
+    # The latest point comes straight from the scalar helpers and is scaled
+    # by the trajectory scale window_worker last computed.
+    id_val = direct_axis_current(ia_ac, ib_ac, ic_ac)
+    iq_val = quadrature_axis_current(ib_ac, ic_ac)
 
     # Latest scaled point (used by GUI for the "Filtered" Park's vector plot)
-    filtered_id = float(id_scaled_win[-1])
-    filtered_iq = float(iq_scaled_win[-1])
+    filtered_id = id_val * window_scale
+    filtered_iq = iq_val * window_scale
 
-    # Also expose the latest unscaled point (useful for debugging / optional plots)
-    id_val = float(id_win[-1])
-    iq_val = float(iq_win[-1])
-
-    # 6) Update GUI if present
-    if gui_app is not None:
+    # 5) Update GUI if present
+    gui = gui_app
+    if gui is not None:
         try:
-            gui_app.add_data_point(
+            gui.add_data_point(
                 t, ax, ay, az, temp, ia, ib, ic,
                 id_val, iq_val,
                 filtered_id, filtered_iq
@@ -237,8 +359,18 @@ async def connect_and_notify(device):
             await asyncio.sleep(1)
 
 async def main():
-    device = await find_device()
-    await connect_and_notify(device)
+    global log_queue
+    log_queue = asyncio.Queue(maxsize=4)
+    log_task = asyncio.create_task(log_worker(log_queue))
+    window_task = asyncio.create_task(window_worker())
+    csv_task = asyncio.create_task(csv_worker(CSV_PATH))
+    try:
+        device = await find_device()
+        await connect_and_notify(device)
+    finally:
+        log_task.cancel()
+        window_task.cancel()
+        csv_task.cancel()
 
 if __name__ == "__main__":
     ser = open_serial(SERIAL_PORT, BAUDRATE)
@@ -248,7 +380,7 @@ if __name__ == "__main__":
     t_serial.start()
 
     try:
-        asyncio.run(main())
+        run_event_loop(main())
     except KeyboardInterrupt:
         print("\nStopping...")
     finally:
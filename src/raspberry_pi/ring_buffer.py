@@ -0,0 +1,87 @@
+import numpy as np
+
+
+class RingBuffer:
+    """Fixed-size ring of the most recent samples, backed by one ndarray.
+
+    With channels=None each sample is a scalar; otherwise each sample is a
+    row of `channels` values, stored as buf[idx] so a push is one write.
+    """
+
+    __slots__ = ("buf", "idx", "full", "sum")
+
+    def __init__(self, size, channels=None, dtype=np.float32):
+        shape = (size,) if channels is None else (size, channels)
+        self.buf = np.empty(shape, dtype=dtype)
+        self.idx = 0          # next slot to write
+        self.full = False     # True once the ring has wrapped
+        # Running sum of the filled part (per channel), for mean()
+        self.sum = np.zeros(shape[1:], dtype=np.float64)[()]
+
+    def __len__(self):
+        return len(self.buf) if self.full else self.idx
+
+    def push(self, x):
+        if self.sum is None:
+            self._resync()
+        if self.full:
+            self.sum -= self.buf[self.idx]
+        self.buf[self.idx] = x
+        # Add the stored (possibly rounded) value so evictions cancel exactly
+        self.sum += self.buf[self.idx]
+        self.idx += 1
+        if self.idx == len(self.buf):
+            self.idx = 0
+            self.full = True
+            # Re-sync once per lap so rounding error can't accumulate
+            self._resync()
+
+    def _resync(self):
+        self.sum = self.window().sum(axis=0, dtype=np.float64)
+
+    def extend(self, xs):
+        # Push a batch of samples (first axis) in at most two slice writes
+        size = len(self.buf)
+        n = len(xs)
+        if n > size:
+            # Only the newest `size` samples survive, ending where n pushes would
+            xs = xs[-size:]
+            self.idx = (self.idx + n - size) % size
+            n = size
+        start = self.idx
+        end = start + n
+        if end <= size:
+            self.buf[start:end] = xs
+        else:
+            split = size - start
+            self.buf[start:] = xs[:split]
+            self.buf[:end - size] = xs[split:]
+        self.idx = end % size
+        self.full = self.full or end >= size
+        # Recomputed on the next mean() or push(), so batches into rings
+        # whose mean is never read don't pay for a reduction
+        self.sum = None
+
+    def mean(self):
+        if self.sum is None:
+            self._resync()
+        # sum is still zero while the ring is empty
+        return self.sum / max(len(self), 1)
+
+    def window(self):
+        # Filled part in storage order, no copy. Fine for reductions that
+        # don't care about sample order (mean, RMS, ...).
+        return self.buf if self.full else self.buf[:self.idx]
+
+    def last(self, n):
+        # Most recent n samples, oldest first (copies only if they wrap)
+        n = min(n, len(self))
+        if n <= self.idx:
+            return self.buf[self.idx - n:self.idx]
+        return np.concatenate((self.buf[self.idx - n:], self.buf[:self.idx]))
+
+    def view(self):
+        # Filled part in time order, oldest first (copies once wrapped)
+        if self.full:
+            return np.concatenate((self.buf[self.idx:], self.buf[:self.idx]))
+        return self.buf[:self.idx]